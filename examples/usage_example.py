@@ -11,6 +11,7 @@ from wazz_shared.database import SessionLocal, Base, engine
 from wazz_shared.models import User, AudioProcessingJob
 from wazz_shared.storage import get_storage_client
 from wazz_shared.schemas import UserCreate, AudioUploadResponse
+import itertools
 import uuid
 
 
@@ -112,8 +113,8 @@ def example_storage():
     url = storage.get_file_url(object_key)
     print(f"File URL: {url}")
 
-    # List files
-    files = storage.list_files(prefix="uploads/")
+    # List files (iter_files is lazy, so only the first 50 keys are fetched)
+    files = list(itertools.islice(storage.iter_files(prefix="uploads/"), 50))
     print(f"Files in uploads/: {files}")
 
     # Download file
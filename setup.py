@@ -2,14 +2,14 @@
 Wazz Audio Shared Library
 Shared code between API service and Worker service
 """
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="wazz-shared",
     version="1.0.0",
     description="Shared library for Wazz Audio services",
     author="Wazz Audio Team",
-    packages=find_packages(),
+    packages=["wazz_shared"],
     python_requires=">=3.9",
     install_requires=[
         "sqlalchemy>=2.0.0",
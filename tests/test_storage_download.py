@@ -0,0 +1,127 @@
+"""StorageClient.download_file and fetch against a stubbed S3 client"""
+
+import io
+import os
+import types
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from wazz_shared import storage
+
+MIB = 1024 * 1024
+
+
+class _Body(io.BytesIO):
+    """Streaming body that drops the connection after fail_after bytes"""
+
+    def __init__(self, data, fail_after=None):
+        super().__init__(data)
+        self.fail_after = fail_after
+
+    def read(self, size=-1):
+        if self.fail_after is not None and self.tell() >= self.fail_after:
+            raise ConnectionResetError("connection dropped")
+        if self.fail_after is not None and size < 0:
+            size = self.fail_after - self.tell()
+        return super().read(size)
+
+
+class _FakeS3:
+    def __init__(self, data, fail_after=None):
+        self.data = data
+        self.fail_after = fail_after
+        self.managed_downloads = []
+        self.bodies = []
+
+    def get_object(self, Bucket, Key, Range=None):
+        data = self.data
+        response = {'ETag': '"etag"'}
+        if Range:
+            first, last = (int(n) for n in Range[len('bytes='):].split('-'))
+            last = min(last, len(data) - 1)
+            response['ContentRange'] = f"bytes {first}-{last}/{len(data)}"
+            data = data[first:last + 1]
+        body = _Body(data, self.fail_after)
+        self.bodies.append(body)
+        response.update(Body=body, ContentLength=len(data))
+        return response
+
+    def download_file(self, bucket, key, file_path, Config=None):
+        self.managed_downloads.append((bucket, key, file_path, Config))
+
+
+@pytest.fixture
+def make_client():
+    def make(fake_s3):
+        settings = types.SimpleNamespace(
+            use_local_storage=False,
+            s3_bucket_name="wazz-audio",
+            s3_multipart_threshold_mb=1,
+            s3_multipart_chunksize_mb=1,
+            s3_max_concurrency=4,
+            s3_io_chunksize_kb=256,
+        )
+        client = storage.StorageClient(settings)
+        client._s3_client = fake_s3
+        return client
+    return make
+
+
+def test_small_object_written_whole(make_client, tmp_path):
+    data = os.urandom(MIB // 2)
+    client = make_client(_FakeS3(data))
+    dest = tmp_path / "out" / "track.wav"
+
+    client.download_file("uploads/track.wav", str(dest))
+
+    assert dest.read_bytes() == data
+    assert os.listdir(dest.parent) == ["track.wav"]
+
+
+def test_failed_read_keeps_existing_file(make_client, tmp_path):
+    dest = tmp_path / "track.wav"
+    dest.write_bytes(b"previous good copy")
+    fake_s3 = _FakeS3(os.urandom(MIB // 2), fail_after=MIB // 4)
+    client = make_client(fake_s3)
+
+    with pytest.raises(ConnectionResetError):
+        client.download_file("uploads/track.wav", str(dest))
+
+    assert dest.read_bytes() == b"previous good copy"
+    assert os.listdir(tmp_path) == ["track.wav"]
+    assert fake_s3.bodies[0].closed
+
+
+def test_large_object_uses_transfer_manager(make_client, tmp_path):
+    fake_s3 = _FakeS3(os.urandom(3 * MIB))
+    client = make_client(fake_s3)
+    dest = str(tmp_path / "track.wav")
+
+    client.download_file("uploads/track.wav", dest)
+
+    assert fake_s3.managed_downloads == [
+        ("wazz-audio", "uploads/track.wav", dest, client.transfer_config)
+    ]
+    assert fake_s3.bodies[0].closed
+    assert os.listdir(tmp_path) == []
+
+
+def test_fetch_failed_read_leaves_no_partial_file(make_client, tmp_path):
+    client = make_client(_FakeS3(os.urandom(MIB), fail_after=MIB // 4))
+    dest = tmp_path / "track.wav"
+
+    with pytest.raises(ConnectionResetError):
+        client.fetch("uploads/track.wav", str(dest))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_fetch_returns_size(make_client, tmp_path):
+    data = os.urandom(MIB)
+    client = make_client(_FakeS3(data))
+    dest = tmp_path / "track.wav"
+
+    assert client.fetch("uploads/track.wav", str(dest)) == len(data)
+    assert dest.read_bytes() == data
@@ -4,17 +4,44 @@ Wazz Audio Shared Library
 This package contains shared code used by both the API service and Worker service.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
 # Import commonly used components for easier access
-from .config import SharedSettings, get_shared_settings
-from .database import Base, get_db, SessionLocal, engine
-from .models import User, AudioProcessingJob, GuestSession, UserUsageStats, TokenBlacklist
-from . import usage_tracking
+from .config import (
+    SharedSettings,
+    CoreSettings,
+    get_shared_settings,
+    get_core_settings,
+    get_s3_settings,
+    get_smtp_settings,
+    get_cors_settings,
+)
+
+# Database components pull in SQLAlchemy and create the engine, so they are
+# imported on first attribute access (PEP 562) rather than with the package.
+_LAZY_ATTRS = {
+    "Base": ".database",
+    "get_db": ".database",
+    "SessionLocal": ".database",
+    "engine": ".database",
+    "User": ".models",
+    "AudioProcessingJob": ".models",
+    "GuestSession": ".models",
+    "UserUsageStats": ".models",
+    "TokenBlacklist": ".models",
+}
+_LAZY_SUBMODULES = {"usage_tracking"}
 
 __all__ = [
     "SharedSettings",
     "get_shared_settings",
+    "CoreSettings",
+    "get_core_settings",
+    "get_s3_settings",
+    "get_smtp_settings",
+    "get_cors_settings",
     "Base",
     "get_db",
     "SessionLocal",
@@ -26,3 +53,19 @@ __all__ = [
     "TokenBlacklist",
     "usage_tracking",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
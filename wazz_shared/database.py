@@ -3,15 +3,34 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from .config import get_shared_settings
+from sqlalchemy.pool import NullPool
+from .config import get_core_settings
+
+settings = get_core_settings()
+
+
+def _engine_options(settings) -> dict:
+    """Build create_engine keyword arguments from the pool settings"""
+    if "sqlite" in settings.database_url:
+        return {"connect_args": {"check_same_thread": False}}
+
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    if settings.db_pool_class == "null":
+        # Let an external pooler (e.g. PgBouncer) own the connections
+        options["poolclass"] = NullPool
+    elif settings.db_pool_class == "queue":
+        options["pool_size"] = settings.db_pool_size
+        options["max_overflow"] = settings.db_max_overflow
+    else:
+        raise ValueError(f"Unsupported db_pool_class: {settings.db_pool_class}")
+    return options
 
-settings = get_shared_settings()
 
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-)
+engine = create_engine(settings.database_url, **_engine_options(settings))
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,27 +1,84 @@
 """Pydantic schemas for request/response validation"""
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, WithJsonSchema, field_validator
+from email_validator import EmailNotValidError, validate_email
+from functools import lru_cache
+from typing import Annotated, Iterable, Optional
 from datetime import datetime
 
 
+@lru_cache(maxsize=10_000)
+def _validate_email_cached(value: str) -> str:
+    """Validate and normalize an email address, memoized per process"""
+    try:
+        return validate_email(value, check_deliverability=False).normalized
+    except EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}") from e
+
+
+# Drop-in replacement for EmailStr that skips repeat work for known addresses
+Email = Annotated[
+    str,
+    AfterValidator(_validate_email_cached),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+# Shared field constraints, declared once and reused across schemas
+Username = Annotated[str, Field(min_length=3, max_length=50)]
+Password = Annotated[str, Field(min_length=8, max_length=72)]
+
+_MISSING = object()
+
+
+def bytes_to_mb(size: int) -> float:
+    """Convert a byte count to megabytes for display, rounded to 2 places"""
+    return round(size / (1024 * 1024), 2)
+
+
+def seconds_to_minutes(seconds: float) -> float:
+    """Convert seconds to minutes for display, rounded to 2 places"""
+    return round(seconds / 60, 2)
+
+
+class OrmModel(BaseModel):
+    """Base for response schemas built from database rows"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Build from a trusted database row without validation (fields must match attribute names)"""
+        values = {}
+        for name, field in cls.model_fields.items():
+            if field.is_required():
+                values[name] = getattr(obj, name)
+            else:
+                value = getattr(obj, name, _MISSING)
+                if value is not _MISSING:
+                    values[name] = value
+        return cls.model_construct(**values)
+
+
 class UserBase(BaseModel):
     """Base user schema"""
 
-    email: EmailStr
-    username: str = Field(..., min_length=3, max_length=50)
+    email: Email
+    username: Username
 
 
 class UserCreate(UserBase):
     """Schema for user registration"""
 
-    password: str = Field(..., min_length=8, max_length=72, description="Password must be between 8 and 72 characters (bcrypt limitation)")
+    password: Password = Field(..., description="Password must be between 8 and 72 characters (bcrypt limitation)")
 
     @field_validator('password')
     @classmethod
     def validate_password_bytes(cls, v: str) -> str:
         """Ensure password is under 72 bytes (bcrypt limitation)"""
-        if len(v.encode('utf-8')) > 72:
+        # ASCII strings are one byte per character, so skip the encode
+        too_long = len(v) > 72 if v.isascii() else len(v.encode('utf-8')) > 72
+        if too_long:
             raise ValueError('Password cannot be longer than 72 bytes when encoded in UTF-8')
         return v
 
@@ -33,17 +90,15 @@ class UserLogin(BaseModel):
     password: str
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, OrmModel):
     """Schema for user response"""
 
+    email: str  # Already validated on the way in, so skip email validation here
     id: int
     is_active: bool
     is_verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class Token(BaseModel):
     """Schema for token response"""
@@ -81,7 +136,7 @@ class GuestTokenResponse(BaseModel):
     expires_in: int  # seconds
 
 
-class GuestSessionResponse(BaseModel):
+class GuestSessionResponse(OrmModel):
     """Schema for guest session information"""
 
     guest_id: str
@@ -89,13 +144,10 @@ class GuestSessionResponse(BaseModel):
     last_active_at: datetime
     expires_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Audio Processing Schemas
 
-class AudioUploadResponse(BaseModel):
+class AudioUploadResponse(OrmModel):
     """Schema for audio upload response"""
 
     job_id: str
@@ -111,13 +163,11 @@ class AudioUploadResponse(BaseModel):
     guest_id: Optional[str] = None
     created_at: datetime
     expires_at: datetime
+    upload_url: Optional[str] = None  # Presigned URL for direct-to-S3 uploads
     message: str = "File uploaded successfully"
 
-    class Config:
-        from_attributes = True
-
 
-class AudioJobStatusResponse(BaseModel):
+class AudioJobStatusResponse(OrmModel):
     """Schema for audio job status response"""
 
     job_id: str
@@ -132,11 +182,8 @@ class AudioJobStatusResponse(BaseModel):
     completed_at: Optional[datetime] = None
     output_available: bool = False
 
-    class Config:
-        from_attributes = True
 
-
-class ProjectResponse(BaseModel):
+class ProjectResponse(OrmModel):
     """Project list item (user-facing audio job summary)"""
 
     job_id: str
@@ -150,9 +197,6 @@ class ProjectResponse(BaseModel):
     file_size: Optional[float] = None
     file_format: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ProjectRenameRequest(BaseModel):
     """Schema for renaming a project"""
@@ -174,9 +218,9 @@ class AdminUserResponse(UserResponse):
 class AdminUserCreate(BaseModel):
     """Schema for admin creating a new user"""
 
-    email: EmailStr
-    username: str = Field(..., min_length=3, max_length=50)
-    password: str = Field(..., min_length=8, max_length=72)
+    email: Email
+    username: Username
+    password: Password
     is_admin: bool = False
     is_verified: bool = False
     is_active: bool = True
@@ -185,8 +229,8 @@ class AdminUserCreate(BaseModel):
 class AdminUserUpdate(BaseModel):
     """Schema for admin updating user details"""
 
-    email: Optional[EmailStr] = None
-    username: Optional[str] = Field(None, min_length=3, max_length=50)
+    email: Optional[Email] = None
+    username: Optional[Username] = None
     is_active: Optional[bool] = None
     is_verified: Optional[bool] = None
     is_admin: Optional[bool] = None
@@ -195,7 +239,7 @@ class AdminUserUpdate(BaseModel):
 class AdminPasswordUpdate(BaseModel):
     """Schema for admin updating user password"""
 
-    new_password: str = Field(..., min_length=8, max_length=72)
+    new_password: Password
 
 
 class AdminPasswordReset(BaseModel):
@@ -209,25 +253,27 @@ class AdminPasswordReset(BaseModel):
 class UsernameUpdate(BaseModel):
     """Schema for updating username"""
 
-    new_username: str = Field(..., min_length=3, max_length=50)
+    new_username: Username
 
 
 class PasswordChange(BaseModel):
     """Schema for changing password"""
 
     current_password: str = Field(..., description="Current password for verification")
-    new_password: str = Field(..., min_length=8, max_length=72, description="New password must be between 8 and 72 characters")
+    new_password: Password = Field(..., description="New password must be between 8 and 72 characters")
 
     @field_validator('new_password')
     @classmethod
     def validate_password_bytes(cls, v: str) -> str:
         """Ensure password is under 72 bytes (bcrypt limitation)"""
-        if len(v.encode('utf-8')) > 72:
+        # ASCII strings are one byte per character, so skip the encode
+        too_long = len(v) > 72 if v.isascii() else len(v.encode('utf-8')) > 72
+        if too_long:
             raise ValueError('Password cannot be longer than 72 bytes when encoded in UTF-8')
         return v
 
 
-class UserSettingsResponse(BaseModel):
+class UserSettingsResponse(OrmModel):
     """Schema for user settings information"""
 
     user_id: int
@@ -237,11 +283,20 @@ class UserSettingsResponse(BaseModel):
     is_verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
-
-class UserUsageStatsResponse(BaseModel):
+    @classmethod
+    def from_orm_fast(cls, user):
+        """Build from a User row (user_id comes from User.id)"""
+        return cls.model_construct(
+            user_id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            created_at=user.created_at,
+        )
+
+
+class UserUsageStatsResponse(OrmModel):
     """Schema for user usage statistics"""
 
     # Audio processing statistics
@@ -269,5 +324,46 @@ class UserUsageStatsResponse(BaseModel):
     api_calls_count: int
     last_api_call_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, stats):
+        """Build from a UserUsageStats row, converting bytes to MB and seconds to minutes"""
+        return cls.model_construct(
+            total_files_uploaded=stats.total_files_uploaded,
+            total_files_processed=stats.total_files_processed,
+            total_files_failed=stats.total_files_failed,
+            total_files_downloaded=stats.total_files_downloaded,
+            total_input_size_mb=bytes_to_mb(stats.total_input_size),
+            total_output_size_mb=bytes_to_mb(stats.total_output_size),
+            total_processing_time_minutes=seconds_to_minutes(stats.total_processing_time),
+            processing_types_count=stats.processing_types_count or {},
+            first_upload_at=stats.first_upload_at,
+            last_upload_at=stats.last_upload_at,
+            last_download_at=stats.last_download_at,
+            api_calls_count=stats.api_calls_count,
+            last_api_call_at=stats.last_api_call_at,
+        )
+
+
+# Bulk Serialization
+#
+# The list core schemas are compiled once here and reused, so list endpoints
+# serialize all rows in a single pydantic-core call.
+
+PROJECT_LIST_ADAPTER = TypeAdapter(list[ProjectResponse])
+JOB_LIST_ADAPTER = TypeAdapter(list[AudioJobStatusResponse])
+ADMIN_USER_LIST_ADAPTER = TypeAdapter(list[AdminUserResponse])
+
+
+def dump_projects_json(rows: Iterable[ProjectResponse]) -> bytes:
+    """Serialize a list of projects to JSON bytes"""
+    return PROJECT_LIST_ADAPTER.dump_json(list(rows))
+
+
+def dump_jobs_json(rows: Iterable[AudioJobStatusResponse]) -> bytes:
+    """Serialize a list of job statuses to JSON bytes"""
+    return JOB_LIST_ADAPTER.dump_json(list(rows))
+
+
+def dump_admin_users_json(rows: Iterable[AdminUserResponse]) -> bytes:
+    """Serialize a list of admin user entries to JSON bytes"""
+    return ADMIN_USER_LIST_ADAPTER.dump_json(list(rows))
@@ -8,14 +8,370 @@ This module provides a single interface that works with either:
 Toggle between them using the use_local_storage setting in config.
 """
 
+import atexit
+import hashlib
+import hmac
+import io
 import os
+import queue
+import secrets
 import shutil
-from typing import BinaryIO, Optional
+import stat
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
+from urllib.parse import quote, urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for userspace copies (shutil's 64 KiB default is too small for audio)
+_COPY_BUFSIZE = 1024 * 1024
+# Bytes requested per in-kernel copy_file_range call
+_KERNEL_COPY_CHUNK = 64 * 1024 * 1024
+
+# Presigned URLs are reused only during the first 10% of their lifetime, so
+# callers always get at least 90% of the validity they asked for
+_URL_REUSE_FRACTION = 0.1
+# Most presigned URLs kept per client; least recently used ones are evicted
+_URL_CACHE_MAX_SIZE = 4096
+
+# How long a prefix listing from file_exists_many answers file_exists (seconds)
+_PREFIX_LISTING_TTL = 5.0
+# Most prefix listings kept per client
+_PREFIX_LISTING_CACHE_SIZE = 256
+
+# DeleteObjects accepts at most 1000 keys per request
+_S3_DELETE_BATCH_SIZE = 1000
+# Multipart upload limits
+_S3_MIN_PART_SIZE = 5 * 1024 * 1024
+_S3_MAX_PARTS = 10000
+# Thread pool size for local bulk deletes
+_LOCAL_DELETE_WORKERS = 8
+
+# Background deletes are flushed after this many seconds or a full batch
+_ASYNC_DELETE_INTERVAL = 0.2
+# Longest interpreter exit will wait for queued background deletes (seconds)
+_ASYNC_DELETE_EXIT_TIMEOUT = 10.0
+
+# (endpoint, bucket) pairs already verified to exist in this process
+_known_buckets = set()
+_known_buckets_lock = threading.Lock()
+
+# S3 error codes that mean "object does not exist"
+_NOT_FOUND_CODES = ('404', 'NoSuchKey', 'NotFound')
+
+
+def _is_not_found(error) -> bool:
+    """Whether a botocore ClientError means the object doesn't exist"""
+    return error.response.get('Error', {}).get('Code') in _NOT_FOUND_CODES
+
+
+def _key_prefix(object_key: str) -> str:
+    """Return the 'directory' part of a key including the trailing slash"""
+    head, sep, _ = object_key.rpartition('/')
+    return head + sep
+
+
+def _copy_fd_range(src_fd: int, dst_fd: int, offset: int = 0) -> Optional[int]:
+    """
+    Copy src_fd from offset to EOF into dst_fd without leaving the kernel
+
+    Returns:
+        End offset in the source, or None if copy_file_range is unsupported
+        here or copied nothing (nothing has been written in that case)
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return None
+
+    start = offset
+    while True:
+        try:
+            copied = os.copy_file_range(src_fd, dst_fd, _KERNEL_COPY_CHUNK, offset)
+        except OSError:
+            if offset == start:
+                return None
+            raise
+        if copied == 0:
+            # Some filesystems (e.g. procfs, sysfs, some FUSE and network
+            # mounts) report 0 instead of failing; let the caller fall back.
+            # At a real EOF the fallback has nothing to copy either.
+            return None if offset == start else offset
+        offset += copied
+
+
+def _copy_file(src_path, dst_path) -> None:
+    """Copy a file with its metadata like shutil.copy2, in-kernel where possible"""
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        copied = _copy_fd_range(src.fileno(), dst.fileno()) is not None
+
+    if not copied:
+        # shutil.copyfile uses os.sendfile on Linux before a read/write loop
+        shutil.copyfile(src_path, dst_path)
+    shutil.copystat(src_path, dst_path)
+
+
+def _drop_page_cache(path, flush: bool = False) -> None:
+    """
+    Ask the kernel to evict a file from the page cache (best effort)
+
+    Args:
+        path: File to evict
+        flush: Write dirty pages out first; only clean pages can be dropped
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if flush:
+            os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _is_os_file(file_obj) -> bool:
+    """Whether file_obj is backed by a real OS file descriptor"""
+    # Checked by type because calling fileno() on e.g. a
+    # SpooledTemporaryFile would force it to roll over to disk.
+    return isinstance(getattr(file_obj, 'raw', file_obj), io.FileIO)
+
+
+def _backing_path(file_obj) -> Optional[str]:
+    """
+    Path of the regular file an open file object reads from, if still valid
+
+    The name is only trusted while it refers to the very same file: it may
+    be relative to a different working directory by now, or the file may
+    have been renamed, unlinked or replaced since it was opened.
+    """
+    name = getattr(file_obj, 'name', None)
+    if not _is_os_file(file_obj) or not isinstance(name, str):
+        return None
+    try:
+        opened = os.fstat(file_obj.fileno())
+        current = os.stat(name)
+    except OSError:
+        return None
+    if not stat.S_ISREG(opened.st_mode) or not os.path.samestat(opened, current):
+        return None
+    return name
+
+
+def _copy_fileobj(file_obj: BinaryIO, dest_file: BinaryIO) -> None:
+    """Copy a file-like object into an open destination file"""
+    if _is_os_file(file_obj):
+        end = _copy_fd_range(file_obj.fileno(), dest_file.fileno(), file_obj.tell())
+        if end is not None:
+            file_obj.seek(end)
+            return
+
+    readinto = getattr(file_obj, 'readinto', None)
+    if readinto is None:
+        shutil.copyfileobj(file_obj, dest_file, _COPY_BUFSIZE)
+        return
+
+    # Reuse one buffer instead of allocating a new bytes object per chunk
+    buf = bytearray(_COPY_BUFSIZE)
+    view = memoryview(buf)
+    while True:
+        n = readinto(view)
+        if not n:
+            break
+        dest_file.write(view[:n])
+
+
+def _write_stream_atomic(stream: BinaryIO, file_path) -> None:
+    """
+    Write a stream to file_path through a temp file renamed into place
+
+    If reading fails, an existing file_path is left untouched and no
+    partial file stays behind. The stream is closed either way.
+    """
+    tmp_path = f"{file_path}.{secrets.token_hex(4)}.part"
+    try:
+        with stream, open(tmp_path, 'xb') as f:
+            shutil.copyfileobj(stream, f, _COPY_BUFSIZE)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=16)
+def _sigv4_signing_key(secret_key: str, datestamp: str, region: str) -> bytes:
+    """Derive the SigV4 signing key; it only changes once per day"""
+    key = ('AWS4' + secret_key).encode('utf-8')
+    for part in (datestamp, region, 's3', 'aws4_request'):
+        key = hmac.new(key, part.encode('utf-8'), hashlib.sha256).digest()
+    return key
+
+
+def _presign_get_url(
+    base_url: str,
+    host: str,
+    path: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    expiration: int,
+    now: Optional[datetime] = None
+) -> str:
+    """
+    Build a SigV4 query-string presigned GET URL
+
+    Only the date, expiry and object path vary per call, so this skips
+    botocore's generic request building and signing pipeline.
+
+    Args:
+        base_url: Scheme and host, e.g. 'https://bucket.s3.us-east-1.amazonaws.com'
+        host: Value of the Host header the client will send
+        path: Already URI-encoded absolute path
+        access_key: AWS access key ID
+        secret_key: AWS secret access key
+        region: Signing region
+        expiration: URL lifetime in seconds
+        now: Signing time (defaults to the current UTC time)
+
+    Returns:
+        Presigned URL
+    """
+    now = now or datetime.now(timezone.utc)
+    amz_date = now.strftime('%Y%m%dT%H%M%SZ')
+    datestamp = amz_date[:8]
+    scope = f"{datestamp}/{region}/s3/aws4_request"
+
+    # Parameters are already in sorted order
+    query = (
+        "X-Amz-Algorithm=AWS4-HMAC-SHA256"
+        f"&X-Amz-Credential={quote(f'{access_key}/{scope}', safe='')}"
+        f"&X-Amz-Date={amz_date}"
+        f"&X-Amz-Expires={expiration}"
+        "&X-Amz-SignedHeaders=host"
+    )
+    canonical_request = f"GET\n{path}\n{query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+    string_to_sign = (
+        f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+        f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+    )
+    signature = hmac.new(
+        _sigv4_signing_key(secret_key, datestamp, region),
+        string_to_sign.encode('utf-8'),
+        hashlib.sha256
+    ).hexdigest()
+    return f"{base_url}{path}?{query}&X-Amz-Signature={signature}"
+
+
+# Queue of (StorageClient, object_key) pairs for delete_file_async
+_delete_queue = queue.Queue()
+_delete_worker = None
+_delete_worker_lock = threading.Lock()
+_delete_exit_hook_registered = False
+
+
+def _run_delete_worker() -> None:
+    """Drain queued deletes into batched delete_files calls (daemon thread)"""
+    while True:
+        batch = [_delete_queue.get()]
+        deadline = time.monotonic() + _ASYNC_DELETE_INTERVAL
+        while len(batch) < _S3_DELETE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_delete_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        by_client = {}
+        for client, object_key in batch:
+            by_client.setdefault(id(client), (client, []))[1].append(object_key)
+        for client, object_keys in by_client.values():
+            try:
+                if client.use_local:
+                    # Sequential on purpose: thread pools refuse new work once
+                    # interpreter shutdown starts, which is when the final flush runs
+                    for object_key in object_keys:
+                        client._delete_local(object_key)
+                else:
+                    client.delete_files(object_keys)
+            except Exception as e:
+                # Nobody is waiting on these deletes, so log instead of raising
+                logger.error(f"Background delete of {len(object_keys)} file(s) failed: {e}")
+
+        for _ in batch:
+            _delete_queue.task_done()
+
+
+def _wait_for_pending_deletes() -> None:
+    """Wait (bounded) for queued deletes to be processed (runs at exit)"""
+    worker = _delete_worker
+    if worker is None or not worker.is_alive():
+        return
+
+    # Queue.join() has no timeout; a hung endpoint must not block shutdown
+    deadline = time.monotonic() + _ASYNC_DELETE_EXIT_TIMEOUT
+    with _delete_queue.all_tasks_done:
+        while _delete_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Exiting with {_delete_queue.unfinished_tasks} background delete(s) unprocessed"
+                )
+                return
+            _delete_queue.all_tasks_done.wait(remaining)
+
+
+def _ensure_delete_worker() -> None:
+    """Start the background delete thread on first use (or if it died)"""
+    global _delete_worker, _delete_exit_hook_registered
+    with _delete_worker_lock:
+        if _delete_worker is None or not _delete_worker.is_alive():
+            _delete_worker = threading.Thread(
+                target=_run_delete_worker, name="storage-delete-worker", daemon=True
+            )
+            _delete_worker.start()
+        if not _delete_exit_hook_registered:
+            atexit.register(_wait_for_pending_deletes)
+            _delete_exit_hook_registered = True
+
+
+def _reset_after_fork() -> None:
+    """
+    Give a forked child (e.g. a Celery prefork worker) its own module state
+
+    The parent's worker thread doesn't exist in the child, and deletes
+    queued before the fork stay with the parent that will process them.
+    Memoized clients are dropped too: their connection pools hold sockets
+    the parent keeps using (e.g. gunicorn --preload).
+    """
+    global _delete_queue, _delete_worker, _delete_worker_lock
+    global _clients, _clients_lock, _known_buckets, _known_buckets_lock
+    _delete_queue = queue.Queue()
+    _delete_worker = None
+    _delete_worker_lock = threading.Lock()
+    _clients = {}
+    _clients_lock = threading.Lock()
+    _known_buckets = set()
+    _known_buckets_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 class StorageClient:
     """
@@ -42,50 +398,143 @@ class StorageClient:
             # Local filesystem mode
             self.base_path = Path("./storage")
             self.base_path.mkdir(exist_ok=True)
+            # Plain-string base for hot paths, avoids Path object churn
+            self._base_path_str = os.fspath(self.base_path)
             logger.info(f"Storage: Using LOCAL filesystem at {self.base_path}")
         else:
-            # S3/MinIO mode
+            # S3/MinIO mode: boto3 is imported and the client built on first use
+            self.bucket = settings.s3_bucket_name
+            self._s3_client = None
+            self._s3_client_lock = threading.Lock()
+
+            # Presigned URL cache: (object_key, expiration) -> (reuse_until, url)
+            self._url_cache = OrderedDict()
+            self._url_cache_lock = threading.Lock()
+
+            # Short-lived prefix listings:
+            # prefix -> (valid_until, set of keys, first key, last key covered),
+            # oldest first; since all share one TTL that is also expiry order
+            self._prefix_listing_cache = OrderedDict()
+            self._prefix_listing_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """boto3 S3 client, created (and the bucket checked) on first access"""
+        client = self._s3_client
+        if client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = self._create_s3_client()
+                client = self._s3_client
+        return client
+
+    def _create_s3_client(self):
+        """Import boto3, build the S3 client and make sure the bucket exists"""
+        settings = self.settings
+        try:
+            import boto3
+            from botocore.client import Config
+            from botocore.exceptions import ClientError
+        except ImportError:
+            raise ImportError(
+                "boto3 is required for S3 storage. "
+                "Install it with: pip install boto3"
+            )
+
+        client = boto3.client(
+            's3',
+            endpoint_url=settings.s3_endpoint_url,
+            aws_access_key_id=settings.s3_access_key,
+            aws_secret_access_key=settings.s3_secret_key,
+            region_name=settings.s3_region,
+            config=Config(
+                signature_version='s3v4',
+                # One pooled connection per transfer thread avoids
+                # "Connection pool is full" churn under concurrency
+                max_pool_connections=max(
+                    settings.s3_max_pool,
+                    settings.s3_max_concurrency,
+                    settings.s3_parallel_max_workers
+                ),
+                retries={'max_attempts': 5, 'mode': 'adaptive'},
+                tcp_keepalive=True
+            ),
+            use_ssl=settings.s3_use_ssl
+        )
+
+        if settings.s3_skip_bucket_check:
+            # Bucket lifecycle is managed outside the application
+            return client
+
+        # Only the first client per bucket in this process needs to probe
+        bucket_id = (settings.s3_endpoint_url, self.bucket)
+        with _known_buckets_lock:
+            if bucket_id in _known_buckets:
+                return client
+
+        # Create bucket if not exists
+        try:
+            client.head_bucket(Bucket=self.bucket)
+            logger.info(f"Storage: Using S3/MinIO bucket '{self.bucket}'")
+        except ClientError:
             try:
-                import boto3
-                from botocore.client import Config
-                from botocore.exceptions import ClientError
-
-                self.s3_client = boto3.client(
-                    's3',
-                    endpoint_url=settings.s3_endpoint_url,
-                    aws_access_key_id=settings.s3_access_key,
-                    aws_secret_access_key=settings.s3_secret_key,
-                    region_name=settings.s3_region,
-                    config=Config(signature_version='s3v4'),
-                    use_ssl=settings.s3_use_ssl
-                )
-                self.bucket = settings.s3_bucket_name
+                client.create_bucket(Bucket=self.bucket)
+                logger.info(f"Storage: Created S3/MinIO bucket '{self.bucket}'")
+            except ClientError as e:
+                logger.error(f"Failed to create bucket: {e}")
+                raise
 
-                # Create bucket if not exists
-                try:
-                    self.s3_client.head_bucket(Bucket=self.bucket)
-                    logger.info(f"Storage: Using S3/MinIO bucket '{self.bucket}'")
-                except ClientError:
-                    try:
-                        self.s3_client.create_bucket(Bucket=self.bucket)
-                        logger.info(f"Storage: Created S3/MinIO bucket '{self.bucket}'")
-                    except ClientError as e:
-                        logger.error(f"Failed to create bucket: {e}")
-                        raise
-
-            except ImportError:
-                raise ImportError(
-                    "boto3 is required for S3 storage. "
-                    "Install it with: pip install boto3"
-                )
+        with _known_buckets_lock:
+            _known_buckets.add(bucket_id)
+        return client
+
+    @cached_property
+    def transfer_config(self):
+        """boto3 TransferConfig used for uploads, downloads and copies"""
+        from boto3.s3.transfer import TransferConfig
+
+        # Large audio files are transferred as concurrent multipart parts.
+        # The threshold must not be below the part size.
+        settings = self.settings
+        chunksize = settings.s3_multipart_chunksize_mb * 1024 * 1024
+        return TransferConfig(
+            multipart_threshold=max(settings.s3_multipart_threshold_mb * 1024 * 1024, chunksize),
+            multipart_chunksize=chunksize,
+            max_concurrency=settings.s3_max_concurrency,
+            io_chunksize=settings.s3_io_chunksize_kb * 1024,
+            use_threads=True
+        )
 
-    def upload_file(self, file_path: str, object_key: str) -> None:
+    def _copy_local(self, src_path, dst_path) -> None:
+        """Copy a file in local mode, keeping large transfers out of the page cache"""
+        _copy_file(src_path, dst_path)
+
+        threshold = self.settings.local_unbuffered_threshold_mb * 1024 * 1024
+        if threshold and os.path.getsize(dst_path) >= threshold:
+            # Large audio is rarely re-read right away; evicting it keeps the
+            # cache for hot data, the effect O_DIRECT would have without its
+            # buffer alignment constraints
+            _drop_page_cache(src_path)
+            _drop_page_cache(dst_path, flush=True)
+
+    def _upload_extra_args(self, content_type: Optional[str]) -> Optional[dict]:
+        """Build boto3 ExtraArgs for uploads"""
+        extra_args = {}
+        if content_type:
+            extra_args['ContentType'] = content_type
+        if self.settings.s3_checksum_algorithm:
+            # S3 verifies the checksum server-side
+            extra_args['ChecksumAlgorithm'] = self.settings.s3_checksum_algorithm
+        return extra_args or None
+
+    def upload_file(self, file_path: str, object_key: str, content_type: Optional[str] = None) -> None:
         """
         Upload file to storage
 
         Args:
             file_path: Local path to file
             object_key: Storage key/path (e.g., 'uploads/file.wav')
+            content_type: Optional MIME type stored with the S3 object
 
         Raises:
             FileNotFoundError: If source file doesn't exist
@@ -98,20 +547,157 @@ class StorageClient:
             # Local filesystem: copy file
             dest_path = self.base_path / object_key
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, dest_path)
+            self._copy_local(file_path, dest_path)
             logger.debug(f"Uploaded to local storage: {object_key}")
         else:
-            # S3/MinIO: upload file
-            self.s3_client.upload_file(file_path, self.bucket, object_key)
+            # S3/MinIO: small files go out in one PutObject, skipping the
+            # transfer manager's thread pool; large ones use multipart
+            extra_args = self._upload_extra_args(content_type)
+            file_size = os.path.getsize(file_path)
+            if file_size < self.transfer_config.multipart_threshold:
+                with open(file_path, 'rb') as body:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket, Key=object_key, Body=body, **(extra_args or {})
+                    )
+            elif self._use_parallel_upload(file_size):
+                # Very long recordings: explicit multipart with wider fan-out
+                self._upload_multipart_parallel(file_path, object_key, file_size, extra_args)
+            else:
+                self.s3_client.upload_file(
+                    file_path, self.bucket, object_key,
+                    ExtraArgs=extra_args,
+                    Config=self.transfer_config
+                )
+            self._forget_listing(object_key)
             logger.debug(f"Uploaded to S3: {object_key}")
 
-    def upload_fileobj(self, file_obj: BinaryIO, object_key: str) -> None:
+    def upload_file_parallel(
+        self,
+        file_path: str,
+        object_key: str,
+        max_workers: Optional[int] = None,
+        part_size: Optional[int] = None,
+        content_type: Optional[str] = None
+    ) -> None:
+        """
+        Upload a very large file as explicit multipart with parallel parts
+
+        Each worker reads its own byte range with os.pread, so there is no
+        shared file position to contend on. Memory use is roughly
+        max_workers * part_size. upload_file() switches to this automatically
+        above s3_parallel_threshold_mb when s3_parallel_max_workers is larger
+        than s3_max_concurrency.
+
+        Args:
+            file_path: Local path to file
+            object_key: Storage key/path
+            max_workers: Parts uploaded concurrently (default s3_parallel_max_workers)
+            part_size: Bytes per part, S3 minimum is 5 MiB (default s3_multipart_chunksize_mb)
+            content_type: Optional MIME type stored with the S3 object
+
+        Raises:
+            FileNotFoundError: If source file doesn't exist
+            Exception: If upload fails (the multipart upload is aborted)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Source file not found: {file_path}")
+        if self.use_local or not hasattr(os, 'pread'):
+            self.upload_file(file_path, object_key, content_type)
+            return
+
+        self._upload_multipart_parallel(
+            file_path,
+            object_key,
+            os.path.getsize(file_path),
+            self._upload_extra_args(content_type),
+            max_workers,
+            part_size
+        )
+
+    def _use_parallel_upload(self, file_size: int) -> bool:
+        """Whether upload_file should fan out wider than the transfer manager"""
+        settings = self.settings
+        return (
+            hasattr(os, 'pread')
+            and settings.s3_parallel_max_workers > settings.s3_max_concurrency
+            and file_size >= settings.s3_parallel_threshold_mb * 1024 * 1024
+        )
+
+    def _upload_multipart_parallel(
+        self,
+        file_path: str,
+        object_key: str,
+        file_size: int,
+        extra_args: Optional[dict],
+        max_workers: Optional[int] = None,
+        part_size: Optional[int] = None
+    ) -> None:
+        """Run a multipart upload with one thread per in-flight part"""
+        # Every in-flight part is held in memory, so this bounds memory use
+        max_workers = max_workers or self.settings.s3_parallel_max_workers
+        part_size = max(part_size or self.transfer_config.multipart_chunksize, _S3_MIN_PART_SIZE)
+        # S3 allows at most 10000 parts per upload
+        part_size = max(part_size, -(-file_size // _S3_MAX_PARTS))
+        part_count = max(1, -(-file_size // part_size))
+
+        extra_args = extra_args or {}
+        checksum_algorithm = extra_args.get('ChecksumAlgorithm')
+        checksum_field = f"Checksum{checksum_algorithm.upper()}" if checksum_algorithm else None
+
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket, Key=object_key, **extra_args
+        )['UploadId']
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            def upload_part(part_number: int) -> dict:
+                body = os.pread(fd, part_size, (part_number - 1) * part_size)
+                part_args = {'ChecksumAlgorithm': checksum_algorithm} if checksum_algorithm else {}
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                    **part_args
+                )
+                part = {'PartNumber': part_number, 'ETag': response['ETag']}
+                if checksum_field and checksum_field in response:
+                    part[checksum_field] = response[checksum_field]
+                return part
+
+            pool = ThreadPoolExecutor(max_workers=min(max_workers, part_count))
+            try:
+                futures = [pool.submit(upload_part, n) for n in range(1, part_count + 1)]
+                parts = [future.result() for future in futures]
+            finally:
+                # On failure, don't keep uploading parts that will be aborted
+                pool.shutdown(cancel_futures=True)
+
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except Exception:
+            # Don't leave orphaned parts accruing storage costs
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=object_key, UploadId=upload_id
+            )
+            raise
+        finally:
+            os.close(fd)
+        self._forget_listing(object_key)
+        logger.debug(f"Uploaded to S3 in {part_count} parallel parts: {object_key}")
+
+    def upload_fileobj(self, file_obj: BinaryIO, object_key: str, content_type: Optional[str] = None) -> None:
         """
         Upload file-like object to storage
 
         Args:
             file_obj: File-like object (must support read())
             object_key: Storage key/path
+            content_type: Optional MIME type stored with the S3 object
 
         Raises:
             Exception: If upload fails
@@ -122,11 +708,23 @@ class StorageClient:
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(dest_path, 'wb') as f:
-                shutil.copyfileobj(file_obj, f)
+                _copy_fileobj(file_obj, f)
             logger.debug(f"Uploaded to local storage: {object_key}")
         else:
-            # S3/MinIO: upload file object
-            self.s3_client.upload_fileobj(file_obj, self.bucket, object_key)
+            # S3/MinIO: an unread file on disk is uploaded by path, so each
+            # multipart worker reads its own range instead of sharing one stream
+            path = _backing_path(file_obj)
+            if path is not None and file_obj.tell() == 0:
+                self.upload_file(path, object_key, content_type)
+                file_obj.seek(0, os.SEEK_END)
+                return
+
+            self.s3_client.upload_fileobj(
+                file_obj, self.bucket, object_key,
+                ExtraArgs=self._upload_extra_args(content_type),
+                Config=self.transfer_config
+            )
+            self._forget_listing(object_key)
             logger.debug(f"Uploaded to S3: {object_key}")
 
     def download_file(self, object_key: str, file_path: str) -> None:
@@ -149,14 +747,145 @@ class StorageClient:
 
             # Create destination directory
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            shutil.copy2(src_path, file_path)
+            self._copy_local(src_path, file_path)
             logger.debug(f"Downloaded from local storage: {object_key}")
         else:
-            # S3/MinIO: download file
+            # S3/MinIO: objects below the multipart threshold come back whole
+            # from one ranged GetObject. Larger ones go to the transfer
+            # manager, which fetches parts concurrently with retries and
+            # only renames its temp file into place once complete.
+            from botocore.exceptions import ClientError
+
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            self.s3_client.download_file(self.bucket, object_key, file_path)
+            threshold = self.transfer_config.multipart_threshold
+            try:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket, Key=object_key, Range=f"bytes=0-{threshold - 1}"
+                )
+            except ClientError as e:
+                # Empty objects have no satisfiable byte range
+                if e.response.get('Error', {}).get('Code') != 'InvalidRange':
+                    raise
+                response = self.s3_client.get_object(Bucket=self.bucket, Key=object_key)
+
+            # ContentRange is 'bytes 0-N/TOTAL'; it is absent on a full response
+            content_range = response.get('ContentRange')
+            if content_range and int(content_range.rpartition('/')[2]) > response['ContentLength']:
+                response['Body'].close()
+                self.s3_client.download_file(
+                    self.bucket, object_key, file_path, Config=self.transfer_config
+                )
+            else:
+                _write_stream_atomic(response['Body'], file_path)
             logger.debug(f"Downloaded from S3: {object_key}")
 
+    def fetch(self, object_key: str, file_path: str) -> int:
+        """
+        Download a file with a single request and return its size
+
+        Replaces the file_exists() -> get_file_size() -> download_file()
+        sequence (three round-trips on S3) with one GetObject.
+
+        Args:
+            object_key: Storage key/path
+            file_path: Local destination path
+
+        Returns:
+            File size in bytes
+
+        Raises:
+            FileNotFoundError: If object doesn't exist
+            Exception: If download fails
+        """
+        dest_dir = os.path.dirname(file_path)
+
+        if self.use_local:
+            # Local filesystem: copy file
+            src_path = os.path.join(self._base_path_str, object_key)
+            if not os.path.isfile(src_path):
+                raise FileNotFoundError(f"Object not found: {object_key}")
+            if dest_dir:
+                os.makedirs(dest_dir, exist_ok=True)
+            self._copy_local(src_path, file_path)
+            logger.debug(f"Downloaded from local storage: {object_key}")
+            return os.path.getsize(file_path)
+
+        # S3/MinIO: existence, size and content all come from one GetObject
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=object_key)
+        except ClientError as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"Object not found: {object_key}") from e
+            raise
+
+        if dest_dir:
+            os.makedirs(dest_dir, exist_ok=True)
+        # A failed read must not leave a truncated file that looks complete
+        _write_stream_atomic(response['Body'], file_path)
+        logger.debug(f"Downloaded from S3: {object_key}")
+        return response['ContentLength']
+
+    def copy_object(self, src_key: str, dst_key: str) -> None:
+        """
+        Copy a file to a new key without moving bytes through this process
+
+        Args:
+            src_key: Existing storage key/path
+            dst_key: Destination storage key/path
+
+        Raises:
+            FileNotFoundError: If the source doesn't exist (local storage)
+            Exception: If copy fails
+        """
+        if self.use_local:
+            # Local filesystem: copy_file_range lets CoW filesystems reflink
+            src_path = self.base_path / src_key
+            if not src_path.exists():
+                raise FileNotFoundError(f"Object not found: {src_key}")
+            dst_path = self.base_path / dst_key
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            _copy_file(src_path, dst_path)
+            logger.debug(f"Copied in local storage: {src_key} -> {dst_key}")
+        else:
+            # S3/MinIO: server-side copy, split into UploadPartCopy calls
+            # for large objects according to the transfer config
+            self.s3_client.copy(
+                {'Bucket': self.bucket, 'Key': src_key},
+                self.bucket,
+                dst_key,
+                Config=self.transfer_config
+            )
+            self._forget_listing(dst_key)
+            logger.debug(f"Copied in S3: {src_key} -> {dst_key}")
+
+    def move_object(self, src_key: str, dst_key: str) -> None:
+        """
+        Move a file to a new key (e.g. from a staging prefix to its final key)
+
+        Args:
+            src_key: Existing storage key/path
+            dst_key: Destination storage key/path
+
+        Raises:
+            FileNotFoundError: If the source doesn't exist (local storage)
+            Exception: If move fails
+        """
+        if self.use_local:
+            # Local filesystem: rename, no data is copied
+            src_path = self.base_path / src_key
+            if not src_path.exists():
+                raise FileNotFoundError(f"Object not found: {src_key}")
+            dst_path = self.base_path / dst_key
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(src_path, dst_path)
+            logger.debug(f"Moved in local storage: {src_key} -> {dst_key}")
+        else:
+            # S3/MinIO: objects can't be renamed, copy server-side then delete
+            self.copy_object(src_key, dst_key)
+            self.delete_file(src_key)
+
     def get_file_url(self, object_key: str, expiration: int = 3600) -> str:
         """
         Generate URL for file access
@@ -178,14 +907,129 @@ class StorageClient:
             file_path = self.base_path / object_key
             return f"file://{file_path.absolute()}"
         else:
-            # S3/MinIO: generate presigned URL
+            # S3/MinIO: reuse a recent presigned URL, signing is CPU-heavy
+            cache_key = (object_key, expiration)
+            now = time.monotonic()
+            with self._url_cache_lock:
+                cached = self._url_cache.get(cache_key)
+                if cached:
+                    self._url_cache.move_to_end(cache_key)
+            if cached and now < cached[0]:
+                return cached[1]
+
             url = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket, 'Key': object_key},
                 ExpiresIn=expiration
             )
+
+            with self._url_cache_lock:
+                self._url_cache[cache_key] = (now + expiration * _URL_REUSE_FRACTION, url)
+                self._url_cache.move_to_end(cache_key)
+                while len(self._url_cache) > _URL_CACHE_MAX_SIZE:
+                    self._url_cache.popitem(last=False)
             return url
 
+    def generate_presigned_url_fast(self, object_key: str, expiration: int = 3600) -> str:
+        """
+        Generate a presigned download URL without going through botocore
+
+        Much cheaper than get_file_url when a response needs many URLs.
+        Produces the same kind of SigV4 query-string URL; configurations it
+        doesn't cover fall back to get_file_url.
+
+        Args:
+            object_key: Storage key/path
+            expiration: URL expiration time in seconds
+
+        Returns:
+            Presigned GET URL for S3, file:// URL for local storage
+        """
+        target = None if self.use_local else self._presign_target
+        if target is None:
+            return self.get_file_url(object_key, expiration)
+
+        base_url, host, path_prefix = target
+        settings = self.settings
+        return _presign_get_url(
+            base_url,
+            host,
+            path_prefix + quote(object_key, safe='/'),
+            settings.s3_access_key,
+            settings.s3_secret_key,
+            settings.s3_region,
+            expiration
+        )
+
+    @cached_property
+    def _presign_target(self) -> Optional[Tuple[str, str, str]]:
+        """(base_url, host, path prefix) for fast presigning, None if unsupported"""
+        settings = self.settings
+        if not settings.s3_access_key or not settings.s3_secret_key:
+            # Credentials come from the environment/instance role
+            return None
+
+        if settings.s3_endpoint_url:
+            # Custom endpoint (MinIO): path-style addressing
+            parts = urlsplit(settings.s3_endpoint_url)
+            if parts.path.strip('/'):
+                return None
+            # Clients omit default ports from the Host header they sign against
+            host = parts.netloc
+            default_port = {'http': ':80', 'https': ':443'}.get(parts.scheme)
+            if default_port and host.endswith(default_port):
+                host = host[:-len(default_port)]
+            return f"{parts.scheme}://{host}", host, f"/{quote(self.bucket, safe='')}/"
+
+        if '.' in self.bucket:
+            # Virtual-hosted TLS certificates don't cover dotted bucket names
+            return None
+        scheme = 'https' if settings.s3_use_ssl else 'http'
+        host = f"{self.bucket}.s3.{settings.s3_region}.amazonaws.com"
+        return f"{scheme}://{host}", host, "/"
+
+    def get_presigned_upload_url(
+        self,
+        object_key: str,
+        expiration: int = 3600,
+        content_type: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Generate a presigned URL so clients can PUT a file directly to S3
+
+        Args:
+            object_key: Storage key/path the client will upload to
+            expiration: URL expiration time in seconds
+            content_type: If set, the client must send the same Content-Type header
+
+        Returns:
+            Presigned PUT URL, or None for local storage (upload through the API instead)
+        """
+        if self.use_local:
+            return None
+
+        params = {'Bucket': self.bucket, 'Key': object_key}
+        if content_type:
+            params['ContentType'] = content_type
+        return self.s3_client.generate_presigned_url(
+            'put_object',
+            Params=params,
+            ExpiresIn=expiration
+        )
+
+    def get_presigned_download_url(self, object_key: str, expiration: int = 3600) -> str:
+        """
+        Generate a URL so clients can download a file directly from storage
+
+        Args:
+            object_key: Storage key/path
+            expiration: URL expiration time in seconds
+
+        Returns:
+            Presigned GET URL for S3, file:// URL for local storage
+        """
+        return self.get_file_url(object_key, expiration)
+
     def delete_file(self, object_key: str) -> None:
         """
         Delete file from storage
@@ -196,22 +1040,88 @@ class StorageClient:
         Raises:
             Exception: If deletion fails
         """
+        self.delete_files([object_key])
+
+    def delete_files(self, object_keys: Iterable[str]) -> None:
+        """
+        Delete many files from storage
+
+        On S3 keys are removed with DeleteObjects, up to 1000 per request.
+        Locally, unlinks run in a small thread pool.
+
+        Args:
+            object_keys: Storage keys/paths
+
+        Raises:
+            Exception: If any deletion fails
+        """
+        object_keys = list(object_keys)
+        if not object_keys:
+            return
+
         if self.use_local:
-            # Local filesystem: delete file
-            file_path = self.base_path / object_key
-            if file_path.exists():
-                file_path.unlink()
-                logger.debug(f"Deleted from local storage: {object_key}")
+            # Local filesystem: delete files
+            if len(object_keys) == 1:
+                self._delete_local(object_keys[0])
             else:
-                logger.warning(f"File not found for deletion: {object_key}")
+                workers = min(_LOCAL_DELETE_WORKERS, len(object_keys))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(self._delete_local, object_keys))
         else:
-            # S3/MinIO: delete object
-            try:
-                self.s3_client.delete_object(Bucket=self.bucket, Key=object_key)
-                logger.debug(f"Deleted from S3: {object_key}")
-            except Exception as e:
-                logger.error(f"Failed to delete from S3: {e}")
-                raise
+            # S3/MinIO: delete objects in batches
+            from botocore.exceptions import ClientError
+
+            for start in range(0, len(object_keys), _S3_DELETE_BATCH_SIZE):
+                batch = object_keys[start:start + _S3_DELETE_BATCH_SIZE]
+                try:
+                    response = self.s3_client.delete_objects(
+                        Bucket=self.bucket,
+                        Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                    )
+                except ClientError as e:
+                    logger.error(f"Failed to delete from S3: {e}")
+                    raise
+
+                for key in batch:
+                    self._forget_listing(key)
+
+                # Quiet mode only reports the keys that failed; an object
+                # that is already gone is not a failure
+                errors = [
+                    error for error in response.get('Errors', [])
+                    if error.get('Code') not in _NOT_FOUND_CODES
+                ]
+                if errors:
+                    first = errors[0]
+                    message = (
+                        f"Failed to delete {len(errors)} object(s) from S3, "
+                        f"first: {first.get('Key')} ({first.get('Code')}: {first.get('Message')})"
+                    )
+                    logger.error(message)
+                    raise RuntimeError(message)
+                logger.debug(f"Deleted {len(batch)} object(s) from S3")
+
+    def delete_file_async(self, object_key: str) -> None:
+        """
+        Queue a file for deletion without waiting for it
+
+        A background thread batches queued keys into delete_files calls
+        (every 200 ms or 1000 keys). Pending deletes are flushed at
+        interpreter exit. Failures are logged, not raised.
+
+        Args:
+            object_key: Storage key/path
+        """
+        _ensure_delete_worker()
+        _delete_queue.put((self, object_key))
+
+    def _delete_local(self, object_key: str) -> None:
+        """Delete a single file from local storage"""
+        try:
+            os.remove(os.path.join(self._base_path_str, object_key))
+            logger.debug(f"Deleted from local storage: {object_key}")
+        except FileNotFoundError:
+            logger.warning(f"File not found for deletion: {object_key}")
 
     def file_exists(self, object_key: str) -> bool:
         """
@@ -225,15 +1135,113 @@ class StorageClient:
         """
         if self.use_local:
             # Local filesystem: check file existence
-            file_path = self.base_path / object_key
-            return file_path.exists()
+            return os.path.isfile(os.path.join(self._base_path_str, object_key))
         else:
-            # S3/MinIO: check object existence
-            try:
-                self.s3_client.head_object(Bucket=self.bucket, Key=object_key)
-                return True
-            except:
+            # S3/MinIO: answer from a recent prefix listing if there is one
+            listing = self._prefix_listing_cache.get(_key_prefix(object_key))
+            if listing and time.monotonic() < listing[0]:
+                _, existing, low, high = listing
+                if low <= object_key <= high:
+                    return object_key in existing
+            return self._head_exists(object_key)
+
+    def _head_exists(self, object_key: str) -> bool:
+        """Check a single S3 object with HEAD; only "not found" maps to False"""
+        from botocore.exceptions import ClientError
+
+        try:
+            self.s3_client.head_object(Bucket=self.bucket, Key=object_key)
+            return True
+        except ClientError as e:
+            if _is_not_found(e):
                 return False
+            raise
+
+    def file_exists_many(self, object_keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check existence of many files at once
+
+        On S3, keys sharing a prefix are resolved by listing only that
+        "directory" level, and only the key range they span, instead of a
+        HEAD request per key. The listing never costs more requests than
+        there are keys; whatever it doesn't reach falls back to HEAD. It is
+        kept for a few seconds so follow-up file_exists() calls in the
+        listed range are free.
+
+        Args:
+            object_keys: Storage keys/paths to check
+
+        Returns:
+            Mapping of object key to existence
+        """
+        object_keys = list(object_keys)
+        if self.use_local:
+            return {key: self.file_exists(key) for key in object_keys}
+
+        by_prefix = {}
+        for key in object_keys:
+            by_prefix.setdefault(_key_prefix(key), []).append(key)
+
+        result = {}
+        for prefix, keys in by_prefix.items():
+            if not prefix or len(keys) == 1:
+                # Listing the bucket root (or for one key) costs more than HEADs
+                for key in keys:
+                    result[key] = self._head_exists(key)
+                continue
+
+            low, high = min(keys), max(keys)
+            existing, covered = self._list_key_range(prefix, low, high, max_pages=len(keys))
+            self._remember_listing(prefix, existing, low, covered)
+            for key in keys:
+                result[key] = key in existing if key <= covered else self._head_exists(key)
+        return result
+
+    def _list_key_range(self, prefix: str, low: str, high: str, max_pages: int):
+        """
+        List the direct children of prefix between low and high (inclusive)
+
+        Returns:
+            (set of existing keys, highest key up to which the set is complete)
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=prefix,
+            Delimiter='/',
+            # StartAfter is exclusive; low minus its last character sorts before it
+            StartAfter=low[:-1],
+            PaginationConfig={'PageSize': 1000}
+        )
+
+        existing = set()
+        covered = low[:-1]
+        for page_number, page in enumerate(pages, start=1):
+            keys = [obj['Key'] for obj in page.get('Contents', [])]
+            existing.update(keys)
+            # Keys and common prefixes come back interleaved in key order
+            last_seen = max(keys + [p['Prefix'] for p in page.get('CommonPrefixes', [])], default=covered)
+            if not page.get('IsTruncated') or last_seen >= high:
+                return existing, high
+            covered = max(covered, last_seen)
+            if page_number >= max_pages:
+                break
+        return existing, covered
+
+    def _remember_listing(self, prefix: str, existing: set, low: str, covered: str) -> None:
+        """Cache a prefix listing, dropping expired and excess old ones"""
+        now = time.monotonic()
+        cache = self._prefix_listing_cache
+        with self._prefix_listing_lock:
+            cache[prefix] = (now + _PREFIX_LISTING_TTL, existing, low, covered)
+            cache.move_to_end(prefix)
+            while len(cache) > _PREFIX_LISTING_CACHE_SIZE or next(iter(cache.values()))[0] <= now:
+                cache.popitem(last=False)
+
+    def _forget_listing(self, object_key: str) -> None:
+        """Drop a cached prefix listing after the prefix was modified"""
+        with self._prefix_listing_lock:
+            self._prefix_listing_cache.pop(_key_prefix(object_key), None)
 
     def get_file_size(self, object_key: str) -> int:
         """
@@ -250,53 +1258,87 @@ class StorageClient:
         """
         if self.use_local:
             # Local filesystem: get file size
-            file_path = self.base_path / object_key
-            if not file_path.exists():
-                raise FileNotFoundError(f"Object not found: {object_key}")
-            return file_path.stat().st_size
+            try:
+                return os.path.getsize(os.path.join(self._base_path_str, object_key))
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Object not found: {object_key}") from None
         else:
             # S3/MinIO: get object size
             response = self.s3_client.head_object(Bucket=self.bucket, Key=object_key)
             return response['ContentLength']
 
-    def list_files(self, prefix: str = "") -> list:
+    def iter_files(self, prefix: str = "") -> Iterator[str]:
         """
-        List files in storage with given prefix
+        Lazily iterate over files in storage with given prefix
+
+        Keys are yielded as they are found, so callers can stop early without
+        listing the whole prefix (S3 pages are fetched on demand).
 
         Args:
             prefix: Key prefix to filter (e.g., 'uploads/')
 
-        Returns:
-            List of object keys
+        Yields:
+            Object keys
         """
         if self.use_local:
-            # Local filesystem: list files
-            search_path = self.base_path / prefix
-            if not search_path.exists():
-                return []
-
-            files = []
-            for item in search_path.rglob('*'):
-                if item.is_file():
-                    # Get relative path from base_path
-                    rel_path = item.relative_to(self.base_path)
-                    files.append(str(rel_path))
-            return files
+            # Local filesystem: walk directory tree with scandir, whose
+            # DirEntry objects answer is_file()/is_dir() from cached stat data
+            base = self._base_path_str
+            search_path = os.path.normpath(os.path.join(base, prefix))
+            if not os.path.isdir(search_path):
+                return
+
+            # Keys are paths relative to base_path
+            strip = len(base) + 1
+            pending = [search_path]
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path[strip:]
         else:
-            # S3/MinIO: list objects
-            response = self.s3_client.list_objects_v2(
+            # S3/MinIO: follow continuation tokens page by page
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
                 Bucket=self.bucket,
-                Prefix=prefix
+                Prefix=prefix,
+                PaginationConfig={'PageSize': 1000}
             )
-            if 'Contents' not in response:
-                return []
-            return [obj['Key'] for obj in response['Contents']]
+            for page in pages:
+                for obj in page.get('Contents', []):
+                    yield obj['Key']
+
+    def list_files(self, prefix: str = "") -> list:
+        """
+        List files in storage with given prefix
+
+        Prefer iter_files() for large prefixes; this materializes every key.
+
+        Args:
+            prefix: Key prefix to filter (e.g., 'uploads/')
+
+        Returns:
+            List of object keys
+        """
+        return list(self.iter_files(prefix))
+
+
+# Process-wide StorageClient instances, keyed by id(settings); reset in
+# forked children by _reset_after_fork
+_clients = {}
+_clients_lock = threading.Lock()
 
 
 def get_storage_client(settings=None):
     """
     Get storage client instance
 
+    Clients are memoized per settings object, so every caller in the
+    process shares one boto3 client and its connection pool. boto3
+    clients are thread-safe, so the instance can be used from worker threads.
+
     Args:
         settings: Optional SharedSettings instance. If not provided, will create one.
 
@@ -307,4 +1349,10 @@ def get_storage_client(settings=None):
         from .config import get_shared_settings
         settings = get_shared_settings()
 
-    return StorageClient(settings)
+    with _clients_lock:
+        entry = _clients.get(id(settings))
+        # Keep a reference to settings so its id can't be reused
+        if entry is None or entry[0] is not settings:
+            entry = (settings, StorageClient(settings))
+            _clients[id(settings)] = entry
+        return entry[1]
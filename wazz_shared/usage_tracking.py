@@ -3,6 +3,7 @@
 from datetime import datetime
 from sqlalchemy.orm import Session
 from wazz_shared.models import UserUsageStats
+from wazz_shared.schemas import bytes_to_mb, seconds_to_minutes
 import os
 import logging
 
@@ -206,12 +207,12 @@ def get_usage_stats(db: Session, user_id: int = None, guest_id: str = None) -> d
         "total_files_downloaded": stats.total_files_downloaded,
 
         # Storage (convert bytes to MB for readability)
-        "total_input_size_mb": round(stats.total_input_size / (1024 * 1024), 2),
-        "total_output_size_mb": round(stats.total_output_size / (1024 * 1024), 2),
-        "average_file_size_mb": round(avg_file_size / (1024 * 1024), 2),
+        "total_input_size_mb": bytes_to_mb(stats.total_input_size),
+        "total_output_size_mb": bytes_to_mb(stats.total_output_size),
+        "average_file_size_mb": bytes_to_mb(avg_file_size),
 
         # Processing time
-        "total_processing_time_minutes": round(stats.total_processing_time / 60, 2),
+        "total_processing_time_minutes": seconds_to_minutes(stats.total_processing_time),
         "average_processing_time_seconds": round(avg_processing_time, 2),
 
         # Processing types breakdown